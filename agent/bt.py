@@ -1,14 +1,16 @@
 """簡易ビヘイビアツリー実装。"""
 from __future__ import annotations
 
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Callable, List
 
 from control.input import InputController
 from core.state import Blackboard
 
 
-class Status(Enum):
+class Status(IntEnum):
+    """比較が小整数の COMPARE_OP で済むよう IntEnum にしている。"""
+
     SUCCESS = auto()
     FAILURE = auto()
     RUNNING = auto()
@@ -32,11 +34,12 @@ class Sequence(Node):
         self._nodes = nodes
 
     def tick(self, blackboard: Blackboard, inputs: InputController) -> Status:
+        success = Status.SUCCESS
         for node in self._nodes:
             status = node.tick(blackboard, inputs)
-            if status != Status.SUCCESS:
+            if status != success:
                 return status
-        return Status.SUCCESS
+        return success
 
 
 class Selector(Node):
@@ -44,11 +47,15 @@ class Selector(Node):
         self._nodes = nodes
 
     def tick(self, blackboard: Blackboard, inputs: InputController) -> Status:
+        # 毎ティック先頭から再評価するリアクティブ意味論。コンパイル経路
+        # （BehaviorTree の VM）と同じ挙動で、高優先度の子による横取りを
+        # どちらの経路でも許す
+        failure = Status.FAILURE
         for node in self._nodes:
             status = node.tick(blackboard, inputs)
-            if status != Status.FAILURE:
+            if status != failure:
                 return status
-        return Status.FAILURE
+        return failure
 
 
 def move_forward_action(blackboard: Blackboard, inputs: InputController) -> Status:
@@ -70,12 +77,81 @@ def stop_action(blackboard: Blackboard, inputs: InputController) -> Status:
     return Status.SUCCESS
 
 
+# フラット化 VM の命令コード。ACT はアクション呼び出し、JNS/JNF は直前の
+# status が SUCCESS/FAILURE 以外のときに指定アドレスへジャンプする。
+_OP_ACT = 0
+_OP_JNS = 1
+_OP_JNF = 2
+
+
 class BehaviorTree:
     def __init__(self, root: Node) -> None:
         self._root = root
+        self._program = self.compile()
+        # 実行用にはタプル 2 本へ分解しておく。命令列は構築後に不変なので
+        # インデックス参照が最速なイミュータブル列で持つ。
+        self._ops = tuple(op for op, _ in self._program)
+        self._args = tuple(arg for _, arg in self._program)
+
+    def compile(self) -> list:
+        """ツリーを (opcode, 引数) の平坦なリストへ変換する。
+
+        Sequence/Selector の再帰的な `tick` ディスパッチを 1 つのループに
+        潰すことで、ティックごとのフレーム生成を子ノード数ぶん減らす。
+        未知のノード型を含む場合は空リストを返し、従来の再帰 tick に
+        フォールバックする。
+        """
+
+        program: list = []
+        try:
+            self._emit(self._root, program)
+        except TypeError:
+            return []
+        return program
+
+    def _emit(self, node: Node, program: list) -> None:
+        if isinstance(node, ActionNode):
+            program.append((_OP_ACT, node._action))
+            return
+        if isinstance(node, (Sequence, Selector)):
+            opcode = _OP_JNS if isinstance(node, Sequence) else _OP_JNF
+            jumps: List[int] = []
+            children = node._nodes
+            for child in children[:-1]:
+                self._emit(child, program)
+                jumps.append(len(program))
+                program.append((opcode, -1))
+            if children:
+                self._emit(children[-1], program)
+            end = len(program)
+            for idx in jumps:
+                program[idx] = (opcode, end)
+            return
+        raise TypeError(f"フラット化できないノード型: {type(node)!r}")
 
     def tick(self, blackboard: Blackboard, inputs: InputController) -> Status:
-        return self._root.tick(blackboard, inputs)
+        ops = self._ops
+        if not ops:
+            return self._root.tick(blackboard, inputs)
+        args = self._args
+        success = Status.SUCCESS
+        failure = Status.FAILURE
+        status = success
+        pc = 0
+        size = len(ops)
+        while pc < size:
+            op = ops[pc]
+            if op == _OP_ACT:
+                status = args[pc](blackboard, inputs)
+            elif op == _OP_JNS:
+                if status != success:
+                    pc = args[pc]
+                    continue
+            elif status != failure:  # _OP_JNF
+                pc = args[pc]
+                continue
+            pc += 1
+        return status
 
 
 def build_default_tree() -> BehaviorTree:
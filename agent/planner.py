@@ -11,6 +11,10 @@ if TYPE_CHECKING:  # pragma: no cover
     from tasks.manager import TaskManager
 
 
+# タスク説明文に含まれる語 → ゴール名の対応表
+_GOAL_TRIGGERS = (("止", "stop"),)
+
+
 @dataclass
 class Skill:
     name: str
@@ -39,6 +43,9 @@ class Planner:
             "stop": StopSkill(name="stop", description="停止"),
         }
         self._task_manager: Optional["TaskManager"] = None
+        self._tree_cache: Dict[str, BehaviorTree] = {}
+        self._last_desc: Optional[str] = None
+        self._last_goal: Optional[str] = None
 
     def bind_task_manager(self, manager: "TaskManager") -> None:
         self._task_manager = manager
@@ -53,11 +60,23 @@ class Planner:
         if not task:
             return default
         text = task.description
-        if "止" in text:
-            return "stop"
-        return default
+        # 説明文は TaskManager 側で intern されるため、同一タスクが続く間は
+        # 同一性比較だけで部分文字列走査を省ける
+        if text is self._last_desc:
+            return self._last_goal if self._last_goal is not None else default
+        goal: Optional[str] = None
+        for trigger, mapped in _GOAL_TRIGGERS:
+            if trigger in text:
+                goal = mapped
+                break
+        self._last_desc = text
+        self._last_goal = goal
+        return goal if goal is not None else default
 
     def plan(self, goal: str, blackboard: Blackboard) -> BehaviorTree:
         effective_goal = self._goal_from_tasks(goal)
-        skill = self.select(effective_goal)
-        return skill.build_tree()
+        tree = self._tree_cache.get(effective_goal)
+        if tree is None:
+            tree = self.select(effective_goal).build_tree()
+            self._tree_cache[effective_goal] = tree
+        return tree
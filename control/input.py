@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, List
 
 try:  # pragma: no cover - 実機環境のみ
     import pydirectinput
@@ -11,37 +11,78 @@ except Exception:  # noqa: BLE001
     pydirectinput = None  # type: ignore
 
 
+def _unavailable(*_args) -> None:
+    raise RuntimeError("pydirectinput が利用できません")
+
+
 class DirectInputDriver:
-    """`pydirectinput` を薄く包むドライバ。"""
+    """`pydirectinput` を薄く包むドライバ。
+
+    利用可否の判定は生成時に 1 度だけ行い、キーイベントごとの
+    グローバル参照と分岐を避けるため関数参照を束縛しておく。
+    """
+
+    def __init__(self) -> None:
+        if pydirectinput:
+            self._key_down = pydirectinput.keyDown
+            self._key_up = pydirectinput.keyUp
+            self._move_rel = pydirectinput.moveRel
+        else:
+            self._key_down = self._key_up = self._move_rel = _unavailable
 
     def key_down(self, key: str) -> None:
-        if not pydirectinput:
-            raise RuntimeError("pydirectinput が利用できません")
-        pydirectinput.keyDown(key)
+        self._key_down(key)
 
     def key_up(self, key: str) -> None:
-        if not pydirectinput:
-            raise RuntimeError("pydirectinput が利用できません")
-        pydirectinput.keyUp(key)
+        self._key_up(key)
 
     def move_rel(self, x: int, y: int) -> None:
-        if not pydirectinput:
-            raise RuntimeError("pydirectinput が利用できません")
-        pydirectinput.moveRel(x, y)
+        self._move_rel(x, y)
+
+
+# よく使うキーの固定 ID 表。未知キーは押下時に末尾へ採番する。
+_KEY_IDS: Dict[str, int] = {
+    key: index for index, key in enumerate(("w", "a", "s", "d", "space", "shift", "ctrl", "e"))
+}
 
 
 @dataclass
 class InputController:
-    """入力を管理し、安全な停止を保証する。"""
+    """入力を管理し、安全な停止を保証する。
+
+    押下開始時刻と最終クリック時刻はキー ID で引く並列配列 (SoA) に
+    持ち、update()/panic_stop() が辞書スナップショットを作らず小さな
+    数値ループで回れるようにしている。
+    """
 
     max_hold_sec: float
     max_click_hz: float
     driver: DirectInputDriver = field(default_factory=DirectInputDriver)
 
-    _held_keys: Dict[str, float] = field(default_factory=dict)
-    _last_click: Dict[str, float] = field(default_factory=dict)
     _allowed_keys: set[str] | None = field(default=None, init=False)
 
+    def __post_init__(self) -> None:
+        self._min_click_interval = 1.0 / self.max_click_hz
+        # 許可キーはビットマスクで判定する（bit i == 1 でキー ID i を許可）
+        self._unrestricted = True
+        self._allowed_mask = 0
+        self._key_ids: Dict[str, int] = dict(_KEY_IDS)
+        self._key_names: List[str] = list(_KEY_IDS)
+        size = len(self._key_names)
+        # -1.0 は「未押下 / 未クリック」を表す番兵値。
+        self._hold_start: List[float] = [-1.0] * size
+        self._last_click: List[float] = [-1.0] * size
+
+    def _key_id(self, key: str) -> int:
+        key_id = self._key_ids.get(key)
+        if key_id is None:
+            key_id = len(self._key_names)
+            self._key_ids[key] = key_id
+            self._key_names.append(key)
+            self._hold_start.append(-1.0)
+            self._last_click.append(-1.0)
+        return key_id
+
     # ------------------------------------------------------------------
     # 許可キー管理
     def set_allowed_keys(self, keys: set[str] | None) -> None:
@@ -49,38 +90,51 @@ class InputController:
 
         if keys is None:
             self._allowed_keys = None
+            self._unrestricted = True
+            self._allowed_mask = 0
         else:
             normalized = {key.strip().lower() for key in keys if key.strip()}
             self._allowed_keys = normalized or set()
-        for held in list(self._held_keys.keys()):
-            if not self._is_allowed(held):
-                self.release(held)
+            self._unrestricted = False
+            mask = 0
+            # 小文字化はここで済ませ、press() 側ではビット検査のみ行う
+            for key in self._allowed_keys:
+                mask |= 1 << self._key_id(key)
+            self._allowed_mask = mask
+        for key_id, start in enumerate(self._hold_start):
+            if start >= 0.0 and not self._is_allowed_id(key_id):
+                self.release(self._key_names[key_id])
 
     def allowed_keys(self) -> set[str] | None:
         return None if self._allowed_keys is None else set(self._allowed_keys)
 
-    def _is_allowed(self, key: str) -> bool:
-        if self._allowed_keys is None:
-            return True
-        return key.lower() in self._allowed_keys
+    def _is_allowed_id(self, key_id: int) -> bool:
+        return self._unrestricted or (self._allowed_mask >> key_id) & 1 == 1
 
     def press(self, key: str) -> None:
-        if not self._is_allowed(key):
+        # ID 表・ビットマスクは小文字で引く（"W" と "w" を同一キー扱い）
+        key = key.lower()
+        key_id = self._key_id(key)
+        if not self._unrestricted and not (self._allowed_mask >> key_id) & 1:
             return
         now = time.perf_counter()
-        if key in self._last_click and now - self._last_click[key] < 1.0 / self.max_click_hz:
+        last = self._last_click[key_id]
+        if last >= 0.0 and now - last < self._min_click_interval:
             return
-        if key in self._held_keys and now - self._held_keys[key] > self.max_hold_sec:
+        start = self._hold_start[key_id]
+        if start >= 0.0 and now - start > self.max_hold_sec:
             self.release(key)
-        if key not in self._held_keys:
+        if self._hold_start[key_id] < 0.0:
             self.driver.key_down(key)
-            self._held_keys[key] = now
-        self._last_click[key] = now
+            self._hold_start[key_id] = now
+        self._last_click[key_id] = now
 
     def release(self, key: str) -> None:
-        if key in self._held_keys:
+        key = key.lower()
+        key_id = self._key_ids.get(key)
+        if key_id is not None and self._hold_start[key_id] >= 0.0:
             self.driver.key_up(key)
-            self._held_keys.pop(key, None)
+            self._hold_start[key_id] = -1.0
 
     def move_mouse(self, x: int, y: int) -> None:
         self.driver.move_rel(x, y)
@@ -88,18 +142,23 @@ class InputController:
     def panic_stop(self) -> None:
         """非常停止。全キーを解放する。"""
 
-        for key in list(self._held_keys.keys()):
-            self.driver.key_up(key)
-        self._held_keys.clear()
+        hold_start = self._hold_start
+        for key_id, start in enumerate(hold_start):
+            if start >= 0.0:
+                self.driver.key_up(self._key_names[key_id])
+                hold_start[key_id] = -1.0
 
     def update(self) -> None:
         """周期処理。長押しし過ぎを防ぐ。"""
 
         now = time.perf_counter()
-        for key, start in list(self._held_keys.items()):
-            if now - start > self.max_hold_sec:
-                self.driver.key_up(key)
-                self._held_keys.pop(key, None)
+        hold_start = self._hold_start
+        limit = self.max_hold_sec
+        for key_id, start in enumerate(hold_start):
+            if start >= 0.0 and now - start > limit:
+                self.driver.key_up(self._key_names[key_id])
+                hold_start[key_id] = -1.0
 
     def is_holding(self, key: str) -> bool:
-        return key in self._held_keys
+        key_id = self._key_ids.get(key.lower())
+        return key_id is not None and self._hold_start[key_id] >= 0.0
@@ -1,8 +1,16 @@
-"""環境設定 `environmentINFO.yml` の読み込みと検証ロジック。"""
-from __future__ import annotations
+"""環境設定 `environmentINFO.yml` の読み込みと検証ロジック。
 
+pydantic モデルを定義するため `from __future__ import annotations` は
+使わない。文字列化された注釈はモデル構築時に get_type_hints での再評価を
+要求し、最初の load_environment を遅くする。
+"""
 import json
 from pathlib import Path
+
+try:  # pragma: no cover - orjson が無い環境でも動かすため
+    import orjson
+except Exception:  # noqa: BLE001
+    orjson = None  # type: ignore
 from typing import Any, Dict, Literal, Optional, Tuple
 
 from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
@@ -79,6 +87,7 @@ class SpeechConfig(BaseModel):
 
 class TasksConfig(BaseModel):
     log_dir: str = "logs"
+    log_format: Literal["csv", "jsonl"] = "jsonl"
     summary_language: Literal["ja", "en"] = "ja"
 
 
@@ -113,9 +122,8 @@ class EnvironmentConfig(BaseModel):
             raise FileNotFoundError(
                 "environmentINFO.yml が見つかりません。`environmentINFO.yml.sample` を参考に作成してください。"
             )
-        raw: Dict[str, Any]
-        with path.open("r", encoding="utf-8") as fp:
-            raw = json.load(fp)
+        data = path.read_bytes()
+        raw: Dict[str, Any] = orjson.loads(data) if orjson else json.loads(data)
         try:
             return cls.model_validate(raw)
         except ValidationError as exc:
@@ -127,9 +135,15 @@ class EnvironmentConfig(BaseModel):
             raise ValueError(f"environmentINFO.yml の検証に失敗しました:\n{message}") from exc
 
     def save(self, path: Path) -> None:
+        # save はユーザー操作時のみのコールドパスなので、ネストした
+        # モデルの直接書き換えを取りこぼすキャッシュは持たず毎回 dump する
         payload = self.model_dump(mode="python")
-        with path.open("w", encoding="utf-8") as fp:
-            json.dump(payload, fp, ensure_ascii=False, indent=2)
+        if orjson:
+            # model_dump(mode="python") は roi をタプルで返すため default で吸収する
+            path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2, default=list))
+        else:
+            with path.open("w", encoding="utf-8") as fp:
+                json.dump(payload, fp, ensure_ascii=False, indent=2)
 
 
 DEFAULT_CONFIG_PATH = Path("environmentINFO.yml")
@@ -1,54 +1,82 @@
 """ブラックボードと観測データの定義。"""
 from __future__ import annotations
 
-from collections import deque
-from dataclasses import dataclass
-from typing import Deque, Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 try:  # pragma: no cover - numpy が無い環境でも動かすため
     import numpy as np
 except Exception:  # noqa: BLE001
     np = None  # type: ignore
 
-from pydantic import BaseModel, Field
 
-
-class Position(BaseModel):
+@dataclass(slots=True)
+class Position:
     x: float
     y: float
     z: float
 
 
-class HudStatus(BaseModel):
-    hp: int = Field(default=20, ge=0, le=20)
-    hunger: int = Field(default=20, ge=0, le=20)
-    hotbar_index: int = Field(default=0, ge=0, le=8)
+@dataclass(slots=True)
+class HudStatus:
+    hp: int = 20
+    hunger: int = 20
+    hotbar_index: int = 0
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.hp <= 20:
+            raise ValueError("hp は 0〜20 の範囲である必要があります")
+        if not 0 <= self.hunger <= 20:
+            raise ValueError("hunger は 0〜20 の範囲である必要があります")
+        if not 0 <= self.hotbar_index <= 8:
+            raise ValueError("hotbar_index は 0〜8 の範囲である必要があります")
 
 
-class OcrStatus(BaseModel):
+@dataclass(slots=True)
+class OcrStatus:
     position: Optional[Position] = None
     raw_text: Optional[str] = None
 
 
-class Blackboard(BaseModel):
-    """システム全体で共有する状態。"""
+# 行動履歴のリングバッファ長
+_HISTORY_SIZE = 32
+
+
+@dataclass(slots=True)
+class Blackboard:
+    """システム全体で共有する状態。
+
+    BT ティックごとに書き換わるため、属性アクセスが素のスロット代入で
+    済むよう検証は生成時のみとする（設定の検証は `core.config` 側で行う）。
+    行動履歴は固定長リスト + 書き込み位置のリングバッファで持ち、追記を
+    リストのスロット代入 2 回に抑える。読み出しは history() を使うこと。
+    """
 
     timestamp: float = 0.0
-    hud: HudStatus = Field(default_factory=HudStatus)
-    ocr: OcrStatus = Field(default_factory=OcrStatus)
+    hud: HudStatus = field(default_factory=HudStatus)
+    ocr: OcrStatus = field(default_factory=OcrStatus)
     center_block: Optional[str] = None
     stuck_counter: int = 0
     current_task: Optional[str] = None
     last_action_reason: Optional[str] = None
 
-    action_history: Deque[str] = Field(default_factory=lambda: deque(maxlen=32))
+    _hist: List[Optional[str]] = field(default_factory=lambda: [None] * _HISTORY_SIZE)
+    _head: int = 0
 
     def push_action(self, description: str) -> None:
-        self.action_history.append(description)
+        self._hist[self._head] = description
+        self._head = (self._head + 1) % _HISTORY_SIZE
 
     def record_reason(self, reason: str) -> None:
         self.last_action_reason = reason
-        self.push_action(reason)
+        self._hist[self._head] = reason
+        self._head = (self._head + 1) % _HISTORY_SIZE
+
+    def history(self) -> List[str]:
+        """古い順に並べた行動履歴を返す（ダンプ用）。"""
+
+        entries = self._hist[self._head :] + self._hist[: self._head]
+        return [entry for entry in entries if entry is not None]
 
     def update_hud(self, hud: HudStatus) -> None:
         self.hud = hud
@@ -65,6 +93,13 @@ class Blackboard(BaseModel):
 
 @dataclass
 class FrameBundle:
+    """キャプチャ 1 回分のフレーム一式。
+
+    downscaled / roi2 はキャプチャ側が使い回すバッファへのビューで、
+    次のキャプチャで上書きされる。読み取り専用として扱い、保持が
+    必要なら呼び出し側で copy() すること。
+    """
+
     full: Optional["np.ndarray"]
     downscaled: Optional["np.ndarray"]
     roi2: Optional["np.ndarray"]
@@ -1,28 +1,28 @@
 from __future__ import annotations
 
 import argparse
+import os
 import signal
 import threading
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional, Set
 
+from agent.bt import Status
 from agent.planner import Planner
 from control.input import InputController
 from core.config import DEFAULT_CONFIG_PATH, EnvironmentConfig, load_environment, save_environment
 from core.state import Blackboard
 from tasks.manager import TaskManager, TaskState
-from vision.capture import DxCameraCapture
-from vision.hud import HudAnalyzer
-from vision.ocr import OCRWorker
 
-try:
-    from ui.inspector import InspectorWindow, LiveWorker
-    from ui.roi_overlay import PreviewMode, RoiSelection, create_overlay_app
-except Exception:  # pragma: no cover - GUI 未サポート環境
-    PreviewMode = RoiSelection = create_overlay_app = None  # type: ignore
-    InspectorWindow = LiveWorker = None  # type: ignore
+# Qt / dxcam / PaddleOCR は import だけで数百 ms〜数秒かかるため、
+# 必要なモードの関数内で遅延 import する（--setup は GPU 系を読まない）。
+
+
+# BT 状態の遷移メッセージ。遷移のたびに f-string を組み立てないよう前計算する。
+_STATUS_MSGS = {status: f"BT 状態: {status.name}" for status in Status}
 
 
 def parse_args() -> argparse.Namespace:
@@ -39,7 +39,9 @@ def ensure_config(path: Path) -> EnvironmentConfig:
 
 
 def run_setup(config: EnvironmentConfig, path: Path) -> int:
-    if create_overlay_app is None:
+    try:
+        from ui.roi_overlay import RoiSelection, create_overlay_app
+    except Exception:  # pragma: no cover - GUI 未サポート環境
         print("PySide6 が利用できないため ROI セットアップを実行できません", file=sys.stderr)
         return 1
     app, overlay = create_overlay_app(
@@ -75,6 +77,10 @@ def run_live(
     allowed_keys: Optional[Set[str]] = None,
     status_callback: Optional[Callable[[str], None]] = None,
 ) -> int:
+    from vision.capture import CaptureThread, DxCameraCapture
+    from vision.hud import HudAnalyzer
+    from vision.ocr import OCRWorker
+
     blackboard = Blackboard()
     inputs = InputController(
         max_hold_sec=config.input.max_hold_sec,
@@ -82,7 +88,7 @@ def run_live(
     )
     inputs.set_allowed_keys(allowed_keys)
     planner = Planner()
-    task_manager = TaskManager(Path(config.tasks.log_dir), blackboard)
+    task_manager = TaskManager(Path(config.tasks.log_dir), blackboard, log_format=config.tasks.log_format)
     planner.bind_task_manager(task_manager)
     tree = planner.plan(config.agent.default_goal, blackboard)
     previous_status = None
@@ -109,39 +115,96 @@ def run_live(
         print(f"OCR 初期化に失敗しました: {exc}", file=sys.stderr)
         ocr = None
 
+    # キャプチャは専用スレッドで回し、BT ティックは最新フレームだけを読む
+    capture_thread: Optional[CaptureThread] = None
+    if capture:
+        capture_thread = CaptureThread(capture)
+        capture_thread.start()
+
+    # HUD 解析は固定サイズのプールへ投げ、結果は次周期以降に回収する。
+    # numpy / Paddle の C 実装内で GIL が外れるため、ROI ごとに submit を
+    # 並べればティックを塞がずに並列解析できる
+    analysis_pool = ThreadPoolExecutor(
+        max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="analysis"
+    )
+    hud_future: Optional["Future[object]"] = None
+
     termination_status = "STOPPED"
+    period = 1.0 / config.agent.bt_tick_rate
+    # ループ内で毎回属性解決しないよう、参照をローカルへ巻き上げておく
+    tick = tree.tick
+    update = inputs.update
+    record_reason = blackboard.record_reason
+    perf_counter = time.perf_counter
+    next_t = perf_counter()
+    last_tick_t = 0.0
     try:
         while True:
-            if capture:
-                try:
-                    result = capture.capture()
+            # 新しいフレームが無ければ盤面は変わっていないので BT 評価を
+            # 省く。生存性のため 1 秒に 1 回は必ずティックする
+            fresh_frame = True
+            if capture_thread:
+                result = capture_thread.latest()
+                if result:
                     blackboard.timestamp = result.timestamp
-                except Exception as exc:  # pragma: no cover - 実機依存
-                    print(f"キャプチャ取得に失敗: {exc}", file=sys.stderr)
-            if stop_event and stop_event.is_set():
-                blackboard.record_reason("停止要求を受信")
-                termination_status = "REQUESTED_STOP"
-                break
-            status = tree.tick(blackboard, inputs)
-            if status != previous_status:
-                previous_status = status
-                blackboard.record_reason(f"BT 状態: {status.name}")
-                if status_callback:
-                    status_callback(status.name)
-            inputs.update()
-            if demo_task_id and demo_start_time and time.perf_counter() - demo_start_time > 1.0:
+                    # 前周期の解析が終わっていれば回収し、新フレームを投入
+                    if hud_future is not None and hud_future.done():
+                        try:
+                            blackboard.hud = hud_future.result()
+                        except Exception as exc:  # noqa: BLE001
+                            print(f"HUD 解析に失敗しました: {exc}", file=sys.stderr)
+                        hud_future = None
+                    if hud_future is None and result.bundle.downscaled is not None:
+                        # downscaled はキャプチャ側が使い回すバッファへの
+                        # ビューで、解析中に次フレームで上書きされる。
+                        # FrameBundle の注意書きどおりコピーを渡す
+                        hud_future = analysis_pool.submit(hud.analyze, result.bundle.downscaled.copy())
+                else:
+                    fresh_frame = False
+            now = perf_counter()
+            if fresh_frame or now - last_tick_t >= 1.0:
+                last_tick_t = now
+                status = tick(blackboard, inputs)
+                if status != previous_status:
+                    previous_status = status
+                    record_reason(_STATUS_MSGS[status])
+                    if status_callback:
+                        status_callback(status.name)
+            # 長押し解放はフレームの有無に関わらず毎周期行う（安全第一）
+            update()
+            if demo_task_id and demo_start_time and perf_counter() - demo_start_time > 1.0:
                 task = task_manager.get_task(demo_task_id)
                 if task.state == TaskState.RUNNING:
                     task_manager.complete_task(demo_task_id, "デモ動作完了")
                     demo_task_id = None
-            time.sleep(0.2)
+            # 経過時間を差し引いた残りだけ待つことで実ティックレートを
+            # config.agent.bt_tick_rate に揃える。停止イベントの監視は
+            # wait の戻り値に兼ねさせ、ループ内の分岐を 1 箇所にまとめる
+            next_t += period
+            now = perf_counter()
+            if now - next_t > 2 * period:
+                # 2 周期以上遅延したらデッドラインを現在時刻へ合わせ直し、
+                # 追い付き連打でさらに遅延が膨らむのを防ぐ
+                next_t = now
+            delay = max(0.0, next_t - now)
+            if stop_event:
+                if stop_event.wait(timeout=delay):
+                    record_reason("停止要求を受信")
+                    termination_status = "REQUESTED_STOP"
+                    break
+            else:
+                time.sleep(delay)
     except KeyboardInterrupt:
         print("ライブループを終了します", file=sys.stderr)
         termination_status = "INTERRUPTED"
     finally:
         inputs.panic_stop()
-        if capture:
+        analysis_pool.shutdown(wait=False, cancel_futures=True)
+        if capture_thread:
+            capture_thread.stop()
+        elif capture:
             capture.stop()
+        task_manager.close()
         if ocr:
             ocr.stop()
         if status_callback:
@@ -150,7 +213,10 @@ def run_live(
 
 
 def run_ui(config: EnvironmentConfig, demo_task: bool = False) -> int:
-    if create_overlay_app is None or InspectorWindow is None or LiveWorker is None:
+    try:
+        from ui.inspector import InspectorWindow, LiveWorker
+        from ui.roi_overlay import PreviewMode, create_overlay_app
+    except Exception:  # pragma: no cover - GUI 未サポート環境
         print("PySide6 が利用できないためインスペクタを表示できません", file=sys.stderr)
         return 1
 
@@ -2,13 +2,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Optional
 
 try:  # pragma: no cover
     from faster_whisper import WhisperModel
 except Exception:  # noqa: BLE001
     WhisperModel = None  # type: ignore
 
+try:  # pragma: no cover - faster-whisper 1.1.0 未満には存在しない
+    from faster_whisper import BatchedInferencePipeline
+except Exception:  # noqa: BLE001
+    BatchedInferencePipeline = None  # type: ignore
+
 
 @dataclass
 class TranscriptionSegment:
@@ -17,13 +22,69 @@ class TranscriptionSegment:
     end: float
 
 
+def _default_compute_type(device: str) -> str:
+    """デバイスに応じた計算精度を選ぶ。
+
+    INT8 量子化は重みのバイト数を半減させてデコーダの DRAM 帯域を節約する。
+    CUDA では Ampere 世代 (compute capability 8.0) 以降なら INT8 テンサー
+    コアを使える int8_float16 を、それ未満では float16 を選ぶ。
+    """
+
+    if device != "cuda":
+        return "int8"
+    try:  # pragma: no cover - GPU 環境のみ
+        import torch
+
+        major, _ = torch.cuda.get_device_capability()
+        return "int8_float16" if major >= 8 else "float16"
+    except Exception:  # noqa: BLE001
+        return "float16"
+
+
 class WhisperTranscriber:
-    def __init__(self, model_size: str = "small", compute_type: str = "float16", device: str = "cuda") -> None:
+    def __init__(self, model_size: str = "small", compute_type: Optional[str] = None, device: str = "cuda") -> None:
         if WhisperModel is None:
             raise RuntimeError("faster-whisper が利用できません")
+        if compute_type is None:
+            compute_type = _default_compute_type(device)
         self._model = WhisperModel(model_size, device=device, compute_type=compute_type)
+        self._batched = (
+            BatchedInferencePipeline(model=self._model) if BatchedInferencePipeline is not None else None
+        )
+
+    def transcribe(
+        self,
+        audio: str,
+        language: str = "ja",
+        batch_size: int = 8,
+        vad_filter: bool = True,
+        vad_parameters: Optional[dict] = None,
+    ) -> Iterable[TranscriptionSegment]:
+        """音声を文字起こしする。
+
+        VAD で切った発話区間を GPU バッチでまとめてデコードすると長尺音声で
+        3〜4 倍速くなるため、利用可能なら BatchedInferencePipeline を使う。
+        CPU 実行などバッチが不利な場合は ``batch_size <= 1`` で逐次デコードに
+        切り替えられる。
+
+        長い無音は 30 秒窓のパディングデコードと幻覚ループの温床になるため、
+        既定で Silero VAD により非発話区間を除去してからエンコーダへ渡す。
+        リアルタイムのマイクゲーティングは従来どおり `speech.vad` が担う。
+        """
 
-    def transcribe(self, audio: str, language: str = "ja") -> Iterable[TranscriptionSegment]:
-        segments, _ = self._model.transcribe(audio, language=language)
+        if vad_filter and vad_parameters is None:
+            vad_parameters = {"min_silence_duration_ms": 500}
+        if self._batched is not None and batch_size > 1:
+            segments, _ = self._batched.transcribe(
+                audio,
+                language=language,
+                batch_size=batch_size,
+                vad_filter=vad_filter,
+                vad_parameters=vad_parameters,
+            )
+        else:
+            segments, _ = self._model.transcribe(
+                audio, language=language, vad_filter=vad_filter, vad_parameters=vad_parameters
+            )
         for segment in segments:
             yield TranscriptionSegment(text=segment.text, start=segment.start, end=segment.end)
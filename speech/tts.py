@@ -1,10 +1,59 @@
 """VOICEVOX HTTP API を利用する TTS ラッパー。"""
 from __future__ import annotations
 
+import asyncio
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import List, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # pragma: no cover - msgspec が無い環境でも動かすため
+    import msgspec
+except Exception:  # noqa: BLE001
+    msgspec = None  # type: ignore
+
+try:  # pragma: no cover - orjson が無い環境でも動かすため
+    import orjson
+except Exception:  # noqa: BLE001
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - httpx は任意依存
+    import httpx
+except Exception:  # noqa: BLE001
+    httpx = None  # type: ignore
+
+# audio_query は数百フィールドの JSON を返すが、こちらが触るのは
+# speedScale 1 つだけ。msgspec の C 実装コーデックが使えるなら往復を
+# そちらへ寄せる（msgspec > orjson > 標準 json の順で選ぶ）。
+if msgspec:
+    _json_decoder = msgspec.json.Decoder()
+    _json_encoder = msgspec.json.Encoder()
+
+    def _loads(data: bytes):
+        return _json_decoder.decode(data)
+
+    def _dumps(obj) -> bytes:
+        return _json_encoder.encode(obj)
+
+elif orjson:
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+else:
+
+    def _loads(data: bytes):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 
 @dataclass
@@ -16,20 +65,83 @@ class VoicevoxConfig:
 class VoicevoxClient:
     def __init__(self, config: VoicevoxConfig) -> None:
         self._config = config
+        # 発話ごとの TCP ハンドシェイクを避けるため keep-alive セッションを使い回す
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.1),
+        )
+        self._session.mount("http://", adapter)
+        self._session.headers["Content-Type"] = "application/json"
+        # 呼び出し側のループを止めずに合成できるよう 2 ワーカーで
+        # 発話 N の synthesis と発話 N+1 の audio_query を重ねられる
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="voicevox")
 
     def synthesize(self, text: str, speed_scale: float = 1.0) -> bytes:
-        query_resp = requests.post(
+        query_resp = self._session.post(
             f"{self._config.host}/audio_query",
             params={"text": text, "speaker": self._config.speaker_id},
         )
         query_resp.raise_for_status()
-        query = query_resp.json()
+        query = _loads(query_resp.content)
         query["speedScale"] = speed_scale
-        synth_resp = requests.post(
+        synth_resp = self._session.post(
             f"{self._config.host}/synthesis",
             params={"speaker": self._config.speaker_id},
-            data=json.dumps(query),
+            data=_dumps(query),
+        )
+        synth_resp.raise_for_status()
+        return synth_resp.content
+
+    def synthesize_async(self, text: str, speed_scale: float = 1.0) -> "Future[bytes]":
+        """合成をバックグラウンドスレッドで実行し Future を返す。"""
+
+        return self._pool.submit(self.synthesize, text, speed_scale)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+        self._session.close()
+
+
+class AsyncVoicevoxClient:
+    """httpx.AsyncClient による非同期 VOICEVOX クライアント。
+
+    1 発話に audio_query と synthesis の 2 往復が必要なため、同期クライアント
+    では n 発話で n*(t_query+t_synth) 掛かる。複数発話を同時に飛ばすと
+    おおむね t_query + n*t_synth まで短縮できる。
+    """
+
+    def __init__(self, config: VoicevoxConfig) -> None:
+        if httpx is None:
+            raise RuntimeError("httpx が利用できません")
+        self._config = config
+        self._client = httpx.AsyncClient(
+            base_url=config.host,
+            limits=httpx.Limits(max_keepalive_connections=4),
             headers={"Content-Type": "application/json"},
         )
+
+    async def synthesize(self, text: str, speed_scale: float = 1.0) -> bytes:
+        query_resp = await self._client.post(
+            "/audio_query",
+            params={"text": text, "speaker": self._config.speaker_id},
+        )
+        query_resp.raise_for_status()
+        query = _loads(query_resp.content)
+        query["speedScale"] = speed_scale
+        synth_resp = await self._client.post(
+            "/synthesis",
+            params={"speaker": self._config.speaker_id},
+            content=_dumps(query),
+        )
         synth_resp.raise_for_status()
         return synth_resp.content
+
+    async def synthesize_batch(self, texts: Sequence[str], speed_scale: float = 1.0) -> List[bytes]:
+        """複数発話をまとめて合成する（ナレーション一括生成用）。"""
+
+        return list(await asyncio.gather(*(self.synthesize(text, speed_scale) for text in texts)))
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import csv
-import uuid
+import itertools
+import json
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -11,13 +14,40 @@ from typing import Dict, Optional
 
 from core.state import Blackboard
 
+try:  # pragma: no cover - orjson が無い環境でも動かすため
+    import orjson
+except Exception:  # noqa: BLE001
+    orjson = None  # type: ignore
 
-class TaskState(str, Enum):
-    NEW = "new"
-    RUNNING = "running"
-    PAUSED = "paused"
-    CANCELED = "canceled"
-    DONE = "done"
+
+# プロセス内で一意なタスク ID の部品。CSPRNG の uuid4 は不要なので、
+# 起動時刻の下位 16bit + 単調カウンタで従来どおり 8 文字の hex を作る。
+_ID_EPOCH = f"{int(time.time()) & 0xFFFF:04x}"
+_ID_COUNTER = itertools.count(1)
+
+
+def _dump_row(record: dict) -> bytes:
+    if orjson:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+class TaskState(int, Enum):
+    """タスク状態。
+
+    str 継承だと == のたびに文字列比較になるため int で持つ。ログや
+    外部向けの文字列表現は label / name 経由で取り出すこと。
+    """
+
+    NEW = 0
+    RUNNING = 1
+    PAUSED = 2
+    CANCELED = 3
+    DONE = 4
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
 
 
 @dataclass
@@ -28,24 +58,74 @@ class Task:
     history: list[str] = field(default_factory=list)
 
     def summary(self) -> str:
-        return f"タスク[{self.id}] {self.description} 状態={self.state}"
+        return f"タスク[{self.id}] {self.description} 状態={self.state.label}"
 
 
 class TaskManager:
-    def __init__(self, log_dir: Path, blackboard: Optional[Blackboard] = None) -> None:
+    def __init__(
+        self,
+        log_dir: Path,
+        blackboard: Optional[Blackboard] = None,
+        log_format: str = "jsonl",
+    ) -> None:
         self._tasks: Dict[str, Task] = {}
-        self._log_path = log_dir / "tasks.log"
         log_dir.mkdir(parents=True, exist_ok=True)
-        if not self._log_path.exists():
-            self._log_path.write_text("timestamp,task_id,state,message\n", encoding="utf-8")
+        # 状態遷移のたびに open/close しないよう開いたまま持つ。jsonl は
+        # 1 行 1 レコードの追記専用で、csv モードでは従来のヘッダ付き形式。
+        # csv 時代の tasks.log へ JSONL 行を混ぜないようファイル名で分ける
+        self._log_writer = None
+        if log_format == "csv":
+            self._log_path = log_dir / "tasks.log"
+            if not self._log_path.exists():
+                self._log_path.write_text("timestamp,task_id,state,message\n", encoding="utf-8")
+            self._log_fp = self._log_path.open("a", encoding="utf-8", newline="", buffering=1)
+            self._log_writer = csv.writer(self._log_fp)
+        else:
+            self._log_path = log_dir / "tasks.jsonl"
+            self._log_fp = self._log_path.open("ab")
         self._blackboard = blackboard
+        # 直近 RUNNING の ID。通常は走査せずに O(1) で引くための近道で、
+        # 指していないときは current_task() 側が走査で補う
+        self._current_task_id: Optional[str] = None
+        # 秒精度のタイムスタンプ文字列キャッシュ（ミリ秒部のみ毎回付け足す）
+        self._ts_sec = -1
+        self._ts_prefix = ""
+        # describe 用の差分更新バッファ。_log を通る遷移ごとに該当行だけ更新する
+        self._summaries: Dict[str, str] = {}
+        self._describe_cache: Optional[str] = None
+
+    def close(self) -> None:
+        """ログファイルを閉じる。ライブループの終了処理から呼ぶ。"""
+
+        if not self._log_fp.closed:
+            self._log_fp.close()
+
+    def _timestamp(self) -> str:
+        """ISO 形式のミリ秒精度タイムスタンプを返す。
+
+        datetime.now().isoformat() の生成はログが頻発すると馬鹿にならない
+        ため、秒が変わったときだけ文字列を作り直し、ミリ秒部のみ毎回
+        付け足す。
+        """
+
+        now = time.time()
+        sec = int(now)
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_prefix = datetime.fromtimestamp(sec).isoformat()
+        return f"{self._ts_prefix}.{int((now - sec) * 1000):03d}"
 
     def _log(self, task: Task, message: str) -> None:
-        timestamp = datetime.now().isoformat()
-        with self._log_path.open("a", encoding="utf-8", newline="") as fp:
-            writer = csv.writer(fp)
-            writer.writerow([timestamp, task.id, task.state.value, message])
+        timestamp = self._timestamp()
+        if self._log_writer is not None:
+            self._log_writer.writerow([timestamp, task.id, task.state.label, message])
+        else:
+            record = {"ts": timestamp, "id": task.id, "state": task.state.label, "msg": message}
+            self._log_fp.write(_dump_row(record))
+            self._log_fp.flush()
         task.history.append(message)
+        self._summaries[task.id] = task.summary()
+        self._describe_cache = None
 
     def _update_blackboard(self, task: Optional[Task]) -> None:
         if not self._blackboard:
@@ -53,8 +133,9 @@ class TaskManager:
         self._blackboard.current_task = task.description if task else None
 
     def create_task(self, description: str, reason: str) -> Task:
-        task_id = uuid.uuid4().hex[:8]
-        task = Task(id=task_id, description=description)
+        task_id = f"{_ID_EPOCH}{next(_ID_COUNTER):04x}"
+        # intern しておくと Planner 側が同一性比較で説明文の再走査を省ける
+        task = Task(id=task_id, description=sys.intern(description))
         self._tasks[task_id] = task
         summary = f"新規タスク: '{description}' を登録。根拠: {reason}"
         self._log(task, summary)
@@ -66,6 +147,7 @@ class TaskManager:
         if task.state not in (TaskState.NEW, TaskState.PAUSED):
             raise ValueError("start_task は new もしくは paused からのみ遷移可能です")
         task.state = TaskState.RUNNING
+        self._current_task_id = task_id
         summary = f"タスク開始: '{task.description}'。根拠: {reason}"
         self._log(task, summary)
         self._update_blackboard(task)
@@ -76,6 +158,8 @@ class TaskManager:
         if task.state != TaskState.RUNNING:
             raise ValueError("pause_task は running からのみ遷移可能です")
         task.state = TaskState.PAUSED
+        if self._current_task_id == task_id:
+            self._current_task_id = None
         self._log(task, f"タスク一時停止: '{task.description}'。理由: {reason}")
         self._update_blackboard(task)
         return task
@@ -85,6 +169,8 @@ class TaskManager:
         if task.state in (TaskState.CANCELED, TaskState.DONE):
             raise ValueError("既に完了または中止済みのタスクです")
         task.state = TaskState.CANCELED
+        if self._current_task_id == task_id:
+            self._current_task_id = None
         self._log(task, f"タスク中止: '{task.description}'。理由: {reason}")
         self._update_blackboard(None)
         return task
@@ -94,6 +180,8 @@ class TaskManager:
         if task.state != TaskState.RUNNING:
             raise ValueError("complete_task は running からのみ遷移可能です")
         task.state = TaskState.DONE
+        if self._current_task_id == task_id:
+            self._current_task_id = None
         self._log(task, f"タスク完了: '{task.description}'。成果: {reason}")
         self._update_blackboard(None)
         return task
@@ -102,11 +190,17 @@ class TaskManager:
         return self._tasks[task_id]
 
     def current_task(self) -> Optional[Task]:
+        if self._current_task_id is not None:
+            return self._tasks[self._current_task_id]
+        # RUNNING が複数あった状態で 1 件を pause/complete するとポインタが
+        # 空になるため、取りこぼしが無いか走査で確認してから None を返す
         for task in self._tasks.values():
             if task.state == TaskState.RUNNING:
+                self._current_task_id = task.id
                 return task
         return None
 
     def describe(self) -> str:
-        lines = [task.summary() for task in self._tasks.values()]
-        return "\n".join(lines)
+        if self._describe_cache is None:
+            self._describe_cache = "\n".join(self._summaries.values())
+        return self._describe_cache
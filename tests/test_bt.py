@@ -0,0 +1,86 @@
+from agent.bt import (
+    _OP_ACT,
+    _OP_JNS,
+    ActionNode,
+    BehaviorTree,
+    Selector,
+    Sequence,
+    Status,
+)
+
+
+class RecordingAction:
+    """tick されるたびに呼び出しを記録し、指定した順に Status を返す。"""
+
+    def __init__(self, name: str, statuses, calls) -> None:
+        self._name = name
+        self._statuses = list(statuses)
+        self._calls = calls
+
+    def __call__(self, blackboard, inputs) -> Status:
+        self._calls.append(self._name)
+        if len(self._statuses) > 1:
+            return self._statuses.pop(0)
+        return self._statuses[0]
+
+
+def test_selector_fallback_and_vm_share_reactive_semantics():
+    # フォールバック経路（Selector.tick）とコンパイル経路（VM）で
+    # セレクタの意味論が一致すること: 毎ティック先頭から再評価し、
+    # 同一ティック内で同じ子を 2 度実行しない
+    for compiled in (False, True):
+        calls = []
+        # a: RUNNING → FAILURE、b: 常に RUNNING
+        a = ActionNode(RecordingAction("a", [Status.RUNNING, Status.FAILURE], calls))
+        b = ActionNode(RecordingAction("b", [Status.RUNNING], calls))
+        selector = Selector([a, b])
+        tick = BehaviorTree(selector).tick if compiled else selector.tick
+
+        assert tick(None, None) == Status.RUNNING
+        assert calls == ["a"]
+        assert tick(None, None) == Status.RUNNING
+        assert calls == ["a", "a", "b"]
+
+
+def test_compile_emits_jump_targets_to_program_end():
+    calls = []
+    actions = [ActionNode(RecordingAction(str(i), [Status.SUCCESS], calls)) for i in range(3)]
+    tree = BehaviorTree(Sequence(actions))
+
+    # ACT, JNS, ACT, JNS, ACT — 中間子の後にだけジャンプが入り、
+    # 飛び先はどちらもプログラム末尾を指す
+    assert tree._ops == (_OP_ACT, _OP_JNS, _OP_ACT, _OP_JNS, _OP_ACT)
+    assert tree._args[1] == len(tree._ops)
+    assert tree._args[3] == len(tree._ops)
+
+
+def test_compiled_sequence_short_circuits_on_failure():
+    calls = []
+    a = ActionNode(RecordingAction("a", [Status.FAILURE], calls))
+    b = ActionNode(RecordingAction("b", [Status.SUCCESS], calls))
+    tree = BehaviorTree(Sequence([a, b]))
+
+    assert tree.tick(None, None) == Status.FAILURE
+    assert calls == ["a"]
+
+
+def test_compiled_nested_tree_matches_recursive_semantics():
+    calls = []
+    fail = ActionNode(RecordingAction("fail", [Status.FAILURE], calls))
+    succ = ActionNode(RecordingAction("succ", [Status.SUCCESS], calls))
+    tail = ActionNode(RecordingAction("tail", [Status.SUCCESS], calls))
+    tree = BehaviorTree(Sequence([Selector([fail, succ]), tail]))
+
+    # Selector は fail→succ と流れ、Sequence が tail へ進んで SUCCESS
+    assert tree.tick(None, None) == Status.SUCCESS
+    assert calls == ["fail", "succ", "tail"]
+
+
+def test_unknown_node_type_falls_back_to_recursive_tick():
+    class CustomNode:
+        def tick(self, blackboard, inputs) -> Status:
+            return Status.SUCCESS
+
+    tree = BehaviorTree(CustomNode())
+    assert tree._ops == ()
+    assert tree.tick(None, None) == Status.SUCCESS
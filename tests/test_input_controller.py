@@ -30,6 +30,19 @@ def test_panic_stop_releases_all_keys():
     assert ("up", "w") in driver.actions
 
 
+def test_press_is_case_insensitive():
+    driver = DummyDriver()
+    controller = InputController(max_hold_sec=1.2, max_click_hz=5, driver=driver)
+    controller.set_allowed_keys({"w"})
+
+    controller.press("W")
+    assert controller.is_holding("w")
+    assert ("down", "w") in driver.actions
+
+    controller.release("W")
+    assert controller.is_holding("W") is False
+
+
 def test_update_releases_long_hold():
     driver = DummyDriver()
     controller = InputController(max_hold_sec=0.01, max_click_hz=5, driver=driver)
@@ -0,0 +1,21 @@
+from vision.ocr import OCRWorker
+
+
+def test_extract_text_joins_recognized_lines():
+    box = [[0, 0], [10, 0], [10, 4], [0, 4]]
+    result = [
+        [
+            [box, ("体力 20", 0.98)],
+            [box, ("満腹度 18", 0.95)],
+        ]
+    ]
+    assert OCRWorker._extract_text(result) == "体力 20\n満腹度 18"
+
+
+def test_extract_text_tolerates_empty_and_malformed_entries():
+    assert OCRWorker._extract_text(None) == ""
+    assert OCRWorker._extract_text([]) == ""
+    assert OCRWorker._extract_text([None]) == ""
+    # 形の崩れたエントリは読み飛ばし、拾えるものだけ返す
+    result = [[["box-only"], [[0], ("ok", 0.9)], None]]
+    assert OCRWorker._extract_text(result) == "ok"
@@ -0,0 +1,20 @@
+from core.state import Blackboard
+
+
+def test_history_returns_entries_in_push_order():
+    bb = Blackboard()
+    bb.push_action("伐採")
+    bb.record_reason("前進する")
+    assert bb.history() == ["伐採", "前進する"]
+    assert bb.last_action_reason == "前進する"
+
+
+def test_history_ring_buffer_keeps_latest_32_entries():
+    bb = Blackboard()
+    for i in range(40):
+        bb.push_action(f"行動{i}")
+    hist = bb.history()
+    assert len(hist) == 32
+    # 古い 8 件が押し出され、残りは古い順に並ぶ
+    assert hist[0] == "行動8"
+    assert hist[-1] == "行動39"
@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 from core.state import Blackboard
@@ -19,6 +20,23 @@ def test_task_state_transitions(tmp_path: Path):
     assert task.state == TaskState.DONE
     assert bb.current_task is None
 
-    log_text = (tmp_path / "tasks.log").read_text(encoding="utf-8")
+    log_text = (tmp_path / "tasks.jsonl").read_text(encoding="utf-8")
     assert "木を1本集める" in log_text
     assert "タスク完了" in log_text
+
+
+def test_jsonl_log_record_shape(tmp_path: Path):
+    manager = TaskManager(tmp_path)
+    task = manager.create_task("石を掘る", "テスト")
+    manager.start_task(task.id, "開始")
+    manager.complete_task(task.id, "完了")
+    manager.close()
+
+    lines = (tmp_path / "tasks.jsonl").read_text(encoding="utf-8").splitlines()
+    records = [json.loads(line) for line in lines]
+    assert len(records) == 3
+    for record in records:
+        assert set(record) == {"ts", "id", "state", "msg"}
+        assert record["id"] == task.id
+    assert [record["state"] for record in records] == ["new", "running", "done"]
+    assert "石を掘る" in records[0]["msg"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 import threading
 from typing import Callable, Optional, Sequence, Set
 
@@ -24,6 +25,19 @@ from PySide6.QtWidgets import (
 from core.config import EnvironmentConfig
 from ui.roi_overlay import PreviewMode, RoiOverlayController
 
+# 許可キー入力の区切り（読点・カンマ・空白をまとめて扱う）
+_KEYS_SEP = re.compile(r"[\s,、]+")
+
+# BT / ワーカー状態の日本語表示。シグナル受信のたびに辞書を作らない。
+_STATUS_JA = {
+    "STOPPED": "停止中",
+    "REQUESTED_STOP": "停止処理中…",
+    "INTERRUPTED": "ユーザー中断",
+    "RUNNING": "実行中",
+    "SUCCESS": "成功",
+    "FAILURE": "失敗",
+}
+
 
 class LiveWorker(QObject):
     """バックグラウンドで `run_live` を実行するワーカー。"""
@@ -148,15 +162,7 @@ class InspectorWindow(QWidget):
             self.update_status("AI 起動中…")
 
     def update_status(self, status: str) -> None:
-        translations = {
-            "STOPPED": "停止中",
-            "REQUESTED_STOP": "停止処理中…",
-            "INTERRUPTED": "ユーザー中断",
-            "RUNNING": "実行中",
-            "SUCCESS": "成功",
-            "FAILURE": "失敗",
-        }
-        self._status_label.setText(translations.get(status, status))
+        self._status_label.setText(_STATUS_JA.get(status, status))
 
     def show_error(self, message: str) -> None:
         QMessageBox.critical(self, "エラー", message)
@@ -185,7 +191,10 @@ class InspectorWindow(QWidget):
         self.start_requested.emit(self.allowed_keys())
 
     def _on_preview_mode_changed(self, text: str) -> None:
-        mode = PreviewMode(text if text in PreviewMode._value2member_map_ else PreviewMode.OFF.value)
+        try:
+            mode = PreviewMode(text)
+        except ValueError:
+            mode = PreviewMode.OFF
         self._overlay.set_preview_mode(mode)
 
     def _on_roi_committed(self, selection) -> None:
@@ -199,9 +208,7 @@ class InspectorWindow(QWidget):
 
     @staticmethod
     def _split_keys(text: str) -> Sequence[str]:
-        cleaned = text.replace("、", ",").replace(" ", ",")
-        parts = [token.strip() for token in cleaned.split(",")]
-        return [token for token in parts if token]
+        return [token for token in _KEYS_SEP.split(text.strip()) if token]
 
     @staticmethod
     def _format_roi(roi) -> str:
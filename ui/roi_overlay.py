@@ -5,15 +5,33 @@ PySide6 を用いてキャプチャ範囲の選択およびプレビューを提
 """
 from __future__ import annotations
 
+import os
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
-from PySide6.QtCore import QPoint, QRect, QSize, Qt, Signal
+from PySide6.QtCore import QLineF, QPoint, QRect, QSize, Qt, Signal
 from PySide6.QtGui import QColor, QGuiApplication, QKeySequence, QPainter, QPen
 from PySide6.QtWidgets import QApplication, QLabel, QRubberBand, QShortcut, QVBoxLayout, QWidget
 
 
+# QKeySequence の文字列解析は安くないため、解析結果をプロセス内で共有する
+_SEQ_CACHE: dict = {}
+
+
+def _seq(text: str) -> QKeySequence:
+    sequence = _SEQ_CACHE.get(text)
+    if sequence is None:
+        sequence = _SEQ_CACHE[text] = QKeySequence(text)
+    return sequence
+
+
+# ドラッグ中の HUD ラベル更新間隔。setText は Qt のテキストレイアウトを
+# 伴うため、マウスイベントのサンプリングレートそのままでは呼ばない
+_HUD_UPDATE_INTERVAL = 1.0 / 60.0
+
+
 class PreviewMode(str, Enum):
     """ROI プレビューの描画モード。"""
 
@@ -22,9 +40,14 @@ class PreviewMode(str, Enum):
     CORNERS = "corners"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoiSelection:
-    """ROI 情報を保持するデータクラス。"""
+    """ROI 情報を保持するデータクラス。
+
+    マウス操作や設定ロードのたびに作られる値オブジェクトなので、
+    __dict__ を持たない slots で小さく保ち、frozen で不変にする
+    （描画キャッシュのキーとしても安全に使える）。
+    """
 
     monitor_id: int
     x: int
@@ -70,7 +93,10 @@ class RoiOverlayController(QWidget):
         self._preview_pen_color = QColor(*preview_color)
 
         self._setup_mode = False
-        self._rubber_band: Optional[QRubberBand] = None
+        # QRubberBand はプラットフォームによってネイティブウィンドウ生成を
+        # 伴うため、セットアップ開始のたびに作り直さず 1 個を使い回す
+        self._rubber_band = QRubberBand(QRubberBand.Shape.Rectangle, self)
+        self._rubber_band.hide()
         self._origin: Optional[QPoint] = None
 
         self._hud = QLabel(self)
@@ -84,9 +110,25 @@ class RoiOverlayController(QWidget):
         layout.addWidget(self._hud, alignment=Qt.AlignmentFlag.AlignTop)
         layout.setContentsMargins(12, 12, 12, 12)
 
+        # paintEvent は OS 都合でも頻繁に呼ばれるため、ROI・モード・色が
+        # 変わらない限り座標変換をやり直さないようキャッシュを持つ
+        self._paint_label: Optional[tuple] = None
+        self._cached_roi_rect: Optional[QRect] = None
+        self._cached_corner_lines: List[QLineF] = []
+        self._last_hud_ts = 0.0
+        self._last_hud_rect = QRect()
+        # 前回描画した領域。再描画要求を ROI 周辺（旧∪新）に絞るために持つ
+        self._last_painted_rect: Optional[QRect] = None
+        # paintEvent までに溜まった無効化領域（設定ロード時の連続 set_* を
+        # 1 回の再描画に合流させる）
+        self._pending_dirty = QRect()
+
+        # ホットキーは初回 show まで遅延する（生成のみで表示しない経路では
+        # QShortcut のコストを払わない）
+        self._hotkeys_installed = False
+
         self._apply_screen_geometry()
         self._apply_window_flags()
-        self._install_hotkeys()
         self.setMouseTracking(True)
 
     # ------------------------------------------------------------------
@@ -108,17 +150,16 @@ class RoiOverlayController(QWidget):
         self.setGeometry(screen.geometry())
 
     def _install_hotkeys(self) -> None:
-        QShortcut(QKeySequence(self._hotkeys.get("roi_reselect", "Ctrl+Alt+R")), self, activated=self.enter_setup_mode)
-        QShortcut(
-            QKeySequence(self._hotkeys.get("border_toggle", "Ctrl+Alt+P")),
-            self,
-            activated=self.toggle_preview,
-        )
-        QShortcut(
-            QKeySequence(self._hotkeys.get("panic", "Ctrl+Alt+X")),
-            self,
-            activated=self._request_panic,
+        if self._hotkeys_installed:
+            return
+        self._hotkeys_installed = True
+        bindings = (
+            ("roi_reselect", "Ctrl+Alt+R", self.enter_setup_mode),
+            ("border_toggle", "Ctrl+Alt+P", self.toggle_preview),
+            ("panic", "Ctrl+Alt+X", self._request_panic),
         )
+        for name, default, handler in bindings:
+            QShortcut(_seq(self._hotkeys.get(name, default)), self, activated=handler)
 
     # ------------------------------------------------------------------
     # 公開 API
@@ -126,7 +167,6 @@ class RoiOverlayController(QWidget):
         """ROI 再選択モードを開始。"""
 
         self._setup_mode = True
-        self._rubber_band = QRubberBand(QRubberBand.Shape.Rectangle, self)
         self._rubber_band.hide()
         self._origin = None
         self._hud.setVisible(True)
@@ -136,10 +176,7 @@ class RoiOverlayController(QWidget):
 
     def leave_setup_mode(self) -> None:
         self._setup_mode = False
-        if self._rubber_band:
-            self._rubber_band.hide()
-            self._rubber_band.deleteLater()
-            self._rubber_band = None
+        self._rubber_band.hide()
         self._origin = None
         self._hud.setVisible(False)
         self._update_mouse_transparency()
@@ -150,7 +187,7 @@ class RoiOverlayController(QWidget):
         self._current_roi = roi
         if not self._setup_mode and not self._preview_enabled:
             self.hide()
-        self.update()
+        self._update_dirty()
 
     def current_roi(self) -> Optional[RoiSelection]:
         return self._current_roi
@@ -167,15 +204,15 @@ class RoiOverlayController(QWidget):
             if not self._setup_mode:
                 self.hide()
         self.preview_toggled.emit(self._preview_enabled, self._preview_mode.value)
-        self.update()
+        self._update_dirty()
 
     def set_preview_mode(self, mode: PreviewMode) -> None:
         self._preview_mode = mode
-        self.update()
+        self._update_dirty()
 
     def set_preview_color(self, color: Tuple[int, int, int, int]) -> None:
         self._preview_pen_color = QColor(*color)
-        self.update()
+        self._update_dirty()
 
     def is_preview_enabled(self) -> bool:
         return self._preview_enabled
@@ -201,28 +238,72 @@ class RoiOverlayController(QWidget):
     def _request_panic(self) -> None:
         self.panic_requested.emit()
 
+    def _schedule_repaint(self, dirty: Optional[QRect] = None) -> None:
+        """再描画は必ず update() 経由で要求する（repaint は同期描画に
+        なるため使わないのが方針）。
+
+        dirty は paintEvent が走るまで和を取りながら溜め込む。設定
+        ロード時のように set_* が連続しても Qt のイベント合流で
+        paintEvent は 1 回にまとまる。
+        """
+
+        if dirty is None:
+            self._pending_dirty = QRect()
+            self.update()
+            return
+        self._pending_dirty = self._pending_dirty.united(dirty)
+        self.update(self._pending_dirty)
+
+    def _update_dirty(self) -> None:
+        """ROI 周辺（旧描画領域 ∪ 新領域）だけ再描画を要求する。
+
+        全画面透過ウィジェットの update() はスクリーン全域の再合成に
+        なるため、線幅ぶんの余白を足した矩形へ絞る。
+        """
+
+        dirty: Optional[QRect] = None
+        if self._current_roi:
+            dirty = self._map_roi_to_widget(self._current_roi).adjusted(-4, -4, 4, 4)
+        if self._last_painted_rect is not None:
+            dirty = self._last_painted_rect if dirty is None else dirty.united(self._last_painted_rect)
+        self._schedule_repaint(dirty)
+
     # ------------------------------------------------------------------
     # イベント処理
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
         if not self._setup_mode or event.button() != Qt.MouseButton.LeftButton:
             return
         self._origin = event.position().toPoint()
-        if self._rubber_band:
-            self._rubber_band.setGeometry(QRect(self._origin, QSize(1, 1)))
-            self._rubber_band.show()
+        self._rubber_band.setGeometry(QRect(self._origin, QSize(1, 1)))
+        self._rubber_band.show()
 
     def mouseMoveEvent(self, event) -> None:  # type: ignore[override]
-        if not self._setup_mode or not self._origin or not self._rubber_band:
+        if not self._setup_mode or not self._origin:
             return
         current = event.position().toPoint()
         rect = QRect(self._origin, current).normalized()
+        # ラバーバンドの追従は軽いので毎イベント行い、テキストレイアウトを
+        # 伴う HUD 更新だけを時間と移動量で間引く
         self._rubber_band.setGeometry(rect)
+        now = time.monotonic()
+        if now - self._last_hud_ts < _HUD_UPDATE_INTERVAL:
+            return
+        last = self._last_hud_rect
+        if (
+            abs(rect.x() - last.x()) < 2
+            and abs(rect.y() - last.y()) < 2
+            and abs(rect.width() - last.width()) < 2
+            and abs(rect.height() - last.height()) < 2
+        ):
+            return
+        self._last_hud_ts = now
+        self._last_hud_rect = QRect(rect)
         self._update_hud(rect)
 
     def mouseReleaseEvent(self, event) -> None:  # type: ignore[override]
         if not self._setup_mode or event.button() != Qt.MouseButton.LeftButton:
             return
-        if not self._rubber_band or not self._origin:
+        if not self._origin:
             return
         rect = self._rubber_band.geometry()
         if rect.width() <= 0 or rect.height() <= 0:
@@ -246,18 +327,48 @@ class RoiOverlayController(QWidget):
         elif event.key() == Qt.Key.Key_Escape:
             self._cancel_roi()
 
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        self._install_hotkeys()
+        super().showEvent(event)
+
+    def moveEvent(self, event) -> None:  # type: ignore[override]
+        # ウィンドウが動くとグローバル→ウィジェット座標の対応が変わる
+        self._paint_label = None
+        super().moveEvent(event)
+
     def paintEvent(self, event) -> None:  # type: ignore[override]
+        self._pending_dirty = QRect()
+        # コンポジタ由来の空領域 expose では QPainter すら作らない
+        if event.region().isEmpty():
+            return
         if not self._preview_enabled or not self._current_roi:
             return
+        label = (
+            self._current_roi.as_tuple(),
+            self._preview_mode,
+            self._preview_pen_color.rgba(),
+        )
+        if label != self._paint_label:
+            self._paint_label = label
+            self._cached_roi_rect = self._map_roi_to_widget(self._current_roi)
+            self._cached_corner_lines = self._corner_lines(self._cached_roi_rect)
+        self._last_painted_rect = self._cached_roi_rect.adjusted(-4, -4, 4, 4)
+        # 無効化領域が ROI に触れない再描画（他ウィンドウの露出など）は描かない
+        bounds = event.region().boundingRect()
+        if not bounds.isNull() and not bounds.intersects(self._last_painted_rect):
+            return
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # 軸平行の矩形と L 字しか描かないためアンチエイリアスは不要。
+        # コスメティックペンにして変換行列による線幅再計算も避ける
         pen = QPen(self._preview_pen_color, 2)
+        pen.setCosmetic(True)
+        pen.setJoinStyle(Qt.PenJoinStyle.MiterJoin)
         painter.setPen(pen)
-        roi_rect = self._map_roi_to_widget(self._current_roi)
+        roi_rect = self._cached_roi_rect
         if self._preview_mode == PreviewMode.LINE:
             painter.drawRect(roi_rect)
         elif self._preview_mode == PreviewMode.CORNERS:
-            self._draw_corners(painter, roi_rect)
+            painter.drawLines(self._cached_corner_lines)
         painter.end()
 
     # ------------------------------------------------------------------
@@ -266,18 +377,25 @@ class RoiOverlayController(QWidget):
         widget_top_left = self.mapFromGlobal(QPoint(roi.x, roi.y))
         return QRect(widget_top_left, roi.to_rect().size())
 
-    def _draw_corners(self, painter: QPainter, rect: QRect) -> None:
-        corner = 24
-        # 上
-        painter.drawLine(rect.topLeft(), rect.topLeft() + QPoint(corner, 0))
-        painter.drawLine(rect.topLeft(), rect.topLeft() + QPoint(0, corner))
-        painter.drawLine(rect.topRight(), rect.topRight() + QPoint(-corner, 0))
-        painter.drawLine(rect.topRight(), rect.topRight() + QPoint(0, corner))
-        # 下
-        painter.drawLine(rect.bottomLeft(), rect.bottomLeft() + QPoint(corner, 0))
-        painter.drawLine(rect.bottomLeft(), rect.bottomLeft() + QPoint(0, -corner))
-        painter.drawLine(rect.bottomRight(), rect.bottomRight() + QPoint(-corner, 0))
-        painter.drawLine(rect.bottomRight(), rect.bottomRight() + QPoint(0, -corner))
+    @staticmethod
+    def _corner_lines(rect: QRect) -> List[QLineF]:
+        """四隅の L 字を構成する 8 線分を返す（drawLines で一括描画する）。"""
+
+        corner = 24.0
+        left, top = float(rect.x()), float(rect.y())
+        right, bottom = float(rect.right()), float(rect.bottom())
+        return [
+            # 上
+            QLineF(left, top, left + corner, top),
+            QLineF(left, top, left, top + corner),
+            QLineF(right, top, right - corner, top),
+            QLineF(right, top, right, top + corner),
+            # 下
+            QLineF(left, bottom, left + corner, bottom),
+            QLineF(left, bottom, left, bottom - corner),
+            QLineF(right, bottom, right - corner, bottom),
+            QLineF(right, bottom, right, bottom - corner),
+        ]
 
     def _update_hud(self, rect: QRect) -> None:
         if not rect.isValid():
@@ -300,6 +418,10 @@ def create_overlay_app(
 ) -> Tuple[QApplication, RoiOverlayController]:
     """テストやスクリプトから簡単に呼び出すためのヘルパー関数。"""
 
+    # オーバーレイは透過背景に HUD ラベルが浮いているだけで、不透明な
+    # 兄弟ウィジェットの重なり計算（subtractOpaqueSiblings）に依存しない。
+    # イベント配送ごとの再帰的なツリー走査を省く（QApplication 生成前に設定）
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
     app = QApplication.instance() or QApplication([])
     selection = None
     if roi:
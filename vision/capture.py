@@ -1,14 +1,23 @@
 """dxcam によるキャプチャ実装。"""
 from __future__ import annotations
 
+import queue
+import sys
+import threading
 import time
 from dataclasses import dataclass
+from typing import Optional
 
 try:  # pragma: no cover - 実機でのみ利用
     import cv2
 except Exception:  # noqa: BLE001
     cv2 = None  # type: ignore
 
+try:  # pragma: no cover - 実機でのみ利用
+    import numpy as np
+except Exception:  # noqa: BLE001
+    np = None  # type: ignore
+
 try:  # pragma: no cover - 実機でのみ利用
     import dxcam
 except Exception:  # noqa: BLE001
@@ -30,39 +39,109 @@ class DxCameraCapture:
     def __init__(self, config: EnvironmentConfig) -> None:
         self._config = config
         self._camera = None
-        self._last_capture = 0.0
-        self._frame_interval = 1.0 / config.vision.frame_rate
+        # 縮小サイズと中央クロップの範囲は設定から決まるので、フレーム
+        # レートで回る _build_bundle で毎回計算せず先に固めておく
+        down = config.capture.downscale
+        self._down_size = (down.width, down.height)
+        half = config.capture.roi2_size // 2
+        cx, cy = down.width // 2, down.height // 2
+        self._crop_slice_y = slice(max(0, cy - half), min(down.height, cy + half))
+        self._crop_slice_x = slice(max(0, cx - half), min(down.width, cx + half))
+        # 縮小出力の使い回しバッファ。チャンネル数が初回フレームまで
+        # 分からないため遅延確保する
+        self._down_buf = None
 
     def _ensure_camera(self) -> None:
         if not dxcam:
             raise RuntimeError("dxcam が利用できません")
         if self._camera is None:
-            self._camera = dxcam.create(device_idx=self._config.capture.monitor_id, output_color="BGR")
-            self._camera.start(region=self._config.capture.roi)
+            # Desktop Duplication のネイティブ形式は BGRA。BGR を要求すると
+            # dxcam がフレームごとに CPU で 4→3ch の詰め替えを行うため、
+            # BGRA のまま受け取る（縮小・OCR 前処理は 4ch を扱える。3ch が
+            # 必要な消費側は frame[..., :3] のゼロコピービューで剥がす）
+            self._camera = dxcam.create(device_idx=self._config.capture.monitor_id, output_color="BGRA")
+            # ビデオモードで回し続けると get_latest_frame は内部バッファの
+            # 最新フレームを返すだけになり、取得ごとの grab を避けられる
+            self._camera.start(
+                region=self._config.capture.roi,
+                target_fps=int(self._config.vision.frame_rate),
+                video_mode=True,
+            )
 
     def capture(self) -> CaptureResult:
         self._ensure_camera()
         assert self._camera is not None
-        now = time.perf_counter()
-        if now - self._last_capture < self._frame_interval:
-            time.sleep(max(0.0, self._frame_interval - (now - self._last_capture)))
+        # video_mode + target_fps で回しているため、ペーシングは dxcam の
+        # ネイティブ側が行う。Python 側で sleep するとタイマー分解能
+        # （Windows 既定 15ms）ぶんのジッタが乗るだけなので何もしない
         frame = self._camera.get_latest_frame()
-        self._last_capture = time.perf_counter()
+        timestamp = time.perf_counter()
         bundle = self._build_bundle(frame)
-        return CaptureResult(bundle=bundle, timestamp=self._last_capture)
+        return CaptureResult(bundle=bundle, timestamp=timestamp)
 
     def _build_bundle(self, frame) -> FrameBundle:
         if cv2 is None or frame is None:
             return FrameBundle(full=frame, downscaled=None, roi2=None)
-        down = cv2.resize(frame, (self._config.capture.downscale.width, self._config.capture.downscale.height))
-        roi_size = self._config.capture.roi2_size
-        h, w = down.shape[:2]
-        cx, cy = w // 2, h // 2
-        half = roi_size // 2
-        roi2 = down[max(0, cy - half) : min(h, cy + half), max(0, cx - half) : min(w, cx + half)]
+        # 縮小は INTER_AREA（縮小方向ではバイリニアより速く品質も良い）。
+        # 出力はフレームごとに確保せずバッファへ上書きする（FrameBundle の
+        # 注意書きどおり、消費側は次キャプチャまでの読み取り専用ビュー）
+        buf = self._down_buf
+        if np is not None:
+            if buf is None or buf.shape[2:] != frame.shape[2:] or buf.dtype != frame.dtype:
+                width, height = self._down_size
+                shape = (height, width) + frame.shape[2:]
+                buf = self._down_buf = np.empty(shape, dtype=frame.dtype)
+            cv2.resize(frame, self._down_size, dst=buf, interpolation=cv2.INTER_AREA)
+            down = buf
+        else:
+            down = cv2.resize(frame, self._down_size, interpolation=cv2.INTER_AREA)
+        roi2 = down[self._crop_slice_y, self._crop_slice_x]
         return FrameBundle(full=frame, downscaled=down, roi2=roi2)
 
     def stop(self) -> None:
         if self._camera:
             self._camera.stop()
             self._camera = None
+
+
+class CaptureThread(threading.Thread):
+    """キャプチャを専用スレッドで回し、最新フレームだけを保持する。
+
+    画面取得のブロックを BT ティックから切り離すため、1 スロットの
+    キューへ古いフレームを捨てながら書き込む。消費側は latest() で
+    届いている最新の CaptureResult を取り出す（無ければ None）。
+    """
+
+    def __init__(self, capture: DxCameraCapture) -> None:
+        super().__init__(name="capture", daemon=True)
+        self._capture = capture
+        self._queue: "queue.Queue[CaptureResult]" = queue.Queue(maxsize=1)
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:  # pragma: no cover - 実機依存
+        while not self._stop_event.is_set():
+            try:
+                result = self._capture.capture()
+            except Exception as exc:  # noqa: BLE001
+                print(f"キャプチャ取得に失敗: {exc}", file=sys.stderr)
+                self._stop_event.wait(0.5)
+                continue
+            if self._queue.full():
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+            self._queue.put(result)
+
+    def latest(self, timeout: Optional[float] = None) -> Optional[CaptureResult]:
+        try:
+            if timeout is None:
+                return self._queue.get_nowait()
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join(timeout=1.0)
+        self._capture.stop()
@@ -2,16 +2,141 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Callable, Optional, Sequence, Tuple
 
 from core.state import HudStatus
 
+try:  # pragma: no cover - 実機でのみ利用
+    import cv2
+except Exception:  # noqa: BLE001
+    cv2 = None  # type: ignore
+
+try:  # pragma: no cover - 実機でのみ利用
+    import numpy as np
+except Exception:  # noqa: BLE001
+    np = None  # type: ignore
+
+try:  # pragma: no cover - numba は任意依存
+    from numba import njit, prange
+except Exception:  # noqa: BLE001
+    njit = None  # type: ignore
+    prange = range  # type: ignore
+
+
+if njit is not None:  # pragma: no cover - numba 環境のみ
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _sad_match(frame, tpl, xs, ys):
+        """候補オフセットごとのテンプレート SAD スコアを返す。
+
+        ピクセルループを LLVM コンパイルし、候補オフセット軸を
+        prange でスレッド分割する。
+        """
+
+        th, tw = tpl.shape
+        scores = np.empty(xs.shape[0], dtype=np.int64)
+        for j in prange(xs.shape[0]):
+            x = xs[j]
+            y = ys[j]
+            acc = 0
+            for r in range(th):
+                for c in range(tw):
+                    d = int(frame[y + r, x + c]) - int(tpl[r, c])
+                    acc += d if d >= 0 else -d
+            scores[j] = acc
+        return scores
+
+else:
+
+    def _sad_match(frame, tpl, xs, ys):
+        """numba が無い環境向けの numpy ベクトル化フォールバック。
+
+        候補オフセット数は高々数十なので、Python ループは外側だけに
+        留めてパッチ差分は numpy の C 実装へ流す。
+        """
+
+        th, tw = tpl.shape
+        tpl16 = tpl.astype(np.int16)
+        scores = np.empty(xs.shape[0], dtype=np.int64)
+        for j in range(xs.shape[0]):
+            patch = frame[ys[j] : ys[j] + th, xs[j] : xs[j] + tw]
+            scores[j] = np.abs(patch.astype(np.int16) - tpl16).sum(dtype=np.int64)
+        return scores
+
+
+def _require_uint8(frame, template) -> None:
+    """照合パスが整数 SAD のまま走ることを入口で保証する。
+
+    順位付けだけが目的なので FP32 の正規化相関は不要。float 配列が
+    紛れ込むと numpy が黙って浮動小数へ昇格してしまうため弾く。
+    """
+
+    if frame.dtype != np.uint8 or template.dtype != np.uint8:
+        raise ValueError("テンプレ照合は uint8 のグレースケール入力のみ対応です")
+
 
 @dataclass
 class HudAnalyzer:
     """テンプレ一致の代替としてダミー計算を提供する。"""
 
     detector: Optional[Callable[["np.ndarray"], HudStatus]] = None
+    # テンプレは個別の ndarray のリストではなく (N, H, W) の連続 uint8
+    # 配列で持つ。照合ループが先頭軸を順に舐めるだけになり、
+    # プリフェッチャが 1 ブロックをストリームできる
+    _hp_templates: Optional["np.ndarray"] = None
+    _hunger_templates: Optional["np.ndarray"] = None
+
+    def load_templates(
+        self,
+        hp_paths: Sequence[str],
+        hunger_paths: Sequence[str],
+    ) -> None:
+        """HP・満腹度アイコンのテンプレ画像を読み込んで束ねる。"""
+
+        self._hp_templates = self._stack(hp_paths)
+        self._hunger_templates = self._stack(hunger_paths)
+
+    @staticmethod
+    def _stack(paths: Sequence[str]) -> Optional["np.ndarray"]:
+        if not paths or cv2 is None:
+            return None
+        images = [cv2.imread(str(path), cv2.IMREAD_GRAYSCALE) for path in paths]
+        if any(image is None for image in images):
+            raise ValueError("テンプレ画像を読み込めませんでした")
+        return np.ascontiguousarray(np.stack(images))
+
+    def best_template(self, frame, templates, xs, ys) -> Tuple[int, int]:
+        """(N, H, W) のテンプレ束から最良一致を探す。
+
+        (テンプレ番号, 候補オフセット番号) を返す。候補が空なら (-1, -1)。
+        """
+
+        if templates is None or xs.shape[0] == 0:
+            return (-1, -1)
+        _require_uint8(frame, templates[0])
+        best_tpl = -1
+        best_pos = -1
+        best_score = None
+        for i in range(templates.shape[0]):
+            scores = _sad_match(frame, templates[i], xs, ys)
+            j = int(np.argmin(scores))
+            if best_score is None or scores[j] < best_score:
+                best_score = scores[j]
+                best_tpl = i
+                best_pos = j
+        return (best_tpl, best_pos)
+
+    def match_template(self, frame, template, xs, ys) -> int:
+        """候補オフセット列のうち SAD 最小のインデックスを返す。
+
+        frame / template はグレースケール uint8 を想定。候補が空の
+        場合は -1。
+        """
+
+        if xs.shape[0] == 0:
+            return -1
+        _require_uint8(frame, template)
+        return int(np.argmin(_sad_match(frame, template, xs, ys)))
 
     def analyze(self, frame) -> HudStatus:
         if self.detector: